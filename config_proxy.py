@@ -3,14 +3,106 @@
 
 import logging
 import os
+import re
 import json
-from typing import Any, Dict, List, Optional, Type
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
 import jsonschema
 from jsonpath_ng import parse as jsonpath
 
+try:
+    import orjson
+
+    _loads = orjson.loads  # pylint: disable=no-member
+except ImportError:
+    _loads = json.loads
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 
 logger = logging.getLogger(__name__)
 
+# Parent directory of this module, searched for config files, see `ConfigProxy.get_config_path`
+_PD = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _mtime(path: str) -> Optional[int]:
+    """Returns modification time of a file in nanoseconds, `None` if the file does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _struct_to_builtins(value: Any) -> Any:
+    """Same as `msgspec.to_builtins`, but keeps struct fields with default values
+    even if the struct uses `omit_defaults`, so that JSON paths can find them.
+    """
+    if isinstance(value, msgspec.Struct):
+        return {
+            field.encode_name: _struct_to_builtins(getattr(value, field.name))
+            for field in msgspec.structs.fields(value)
+        }
+    if isinstance(value, dict):
+        return {key: _struct_to_builtins(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_struct_to_builtins(item) for item in value]
+    return msgspec.to_builtins(value)
+
+
+@lru_cache(maxsize=512)
+def _parse_jsonpath(path: str):
+    """Parse JSON path and cache the compiled expression, since parsing is expensive."""
+    return jsonpath(path)
+
+
+_SIMPLE_PATH_RE = re.compile(r"^[A-Za-z_]\w*(\.[A-Za-z_]\w*|\[\d+\])*$")
+_SIMPLE_TOKEN_RE = re.compile(r"([A-Za-z_]\w*)|\[(\d+)\]")
+_MISSING = object()
+_match_value = attrgetter("value")
+
+
+def _split_simple(path: str) -> Tuple[Union[str, int], ...]:
+    """Split simple dotted path (e.g. `a.b[2].c`) into dictionary keys and list indices."""
+    return tuple(key if key else int(index) for key, index in _SIMPLE_TOKEN_RE.findall(path))
+
+
+def _simple_lookup(config: Any, tokens: Tuple[Union[str, int], ...]) -> Any:
+    """Walk the config directly using `tokens`, returns `_MISSING` if the path does not exist."""
+    try:
+        for token in tokens:
+            config = config[token]
+    except (KeyError, IndexError, TypeError):
+        return _MISSING
+    return config
+
+
+def _collect_simple(config: Any, node: Tuple[dict, List[str]], found: Dict[str, Any]) -> None:
+    """Descend `config` along a trie of simple path tokens, storing values of all paths ending in visited nodes."""
+    children, paths = node
+    for path in paths:
+        found[path] = config
+    for token, child in children.items():
+        try:
+            value = config[token]
+        except (KeyError, IndexError, TypeError):
+            continue
+        _collect_simple(value, child, found)
+
+
+@lru_cache(maxsize=512)
+def _compile_path(path: str) -> Any:
+    """Return tokens for simple dotted paths, which do not need full JSON path parser,
+    and parsed JSON path expression otherwise.
+    """
+    if _SIMPLE_PATH_RE.match(path):
+        return _split_simple(path)
+    return _parse_jsonpath(path)
+
 
 class ConfigProxy:
     """Proxy to your configuration. It loads json file,
@@ -32,6 +124,11 @@ class ConfigProxy:
         config_file_names = ["settings.json"]
     ```
 
+    If [msgspec](https://jcristharif.com/msgspec/) is installed, you can set
+    `msgspec_type` to a type (e.g. a `msgspec.Struct` subclass) describing your
+    config. The config is then validated while it is being decoded instead of
+    using json schema and the decoded object is available as `typed_config`.
+
     If you create a subclass, do not forget to actually pass
     it to all of your properties:
 
@@ -44,6 +141,11 @@ class ConfigProxy:
     config_file_names: List[str] = ["config.json"]
     current_config: Optional["ConfigProxy"] = None
     strict: bool = True
+    msgspec_type: Optional[Type] = None
+    # Maps schema path to its modification time, the schema itself and compiled validator
+    _schema_cache: Dict[str, Tuple[int, dict, Any]] = {}
+    _env_generation: int = 0
+    _resolved_path: Optional[str] = None
 
     def __init__(self, config_path: Optional[str]):
         """Class constructor. You are not supposed to actually create
@@ -57,25 +159,61 @@ class ConfigProxy:
             FileNotFoundError: Specified configuration file was not found.
         """
         self.config_path = config_path
+        self.typed_config: Optional[Any] = None
+        self._config_mtime: Optional[int] = None
+        self._schema_path: Optional[str] = None
+        self._schema_mtime: Optional[int] = None
         if self.config_path is None:
             if not self.strict:
                 self.config = {}
                 self.schema = {}
                 return
             raise FileNotFoundError("Config file was not found")
-        if not os.path.exists(self.config_path):
-            raise FileNotFoundError(f"Configuration file not found in {self.config_path}")
         main_dirname = os.path.abspath(os.path.dirname(__file__))
         schema_path = os.path.join(main_dirname, "config.schema.json")
-        with open(self.config_path, "r", encoding="utf-8") as fid:
-            self.config: dict = json.load(fid)
-        if not os.path.exists(schema_path):
+        try:
+            fid = open(self.config_path, "rb")
+        except FileNotFoundError as error:
+            raise FileNotFoundError(f"Configuration file not found in {self.config_path}") from error
+        logger.info("Loading config file %s", self.config_path)
+        with fid:
+            self._config_mtime = os.fstat(fid.fileno()).st_mtime_ns
+            data = fid.read()
+        if self.msgspec_type is not None:
+            if msgspec is None:
+                raise ImportError("msgspec must be installed in order to use msgspec_type")
+            # msgspec validates the config while decoding it, so the json schema is not used at all
+            self.typed_config = msgspec.json.decode(data, type=self.msgspec_type)
+            self.config = _struct_to_builtins(self.typed_config)
+            self.schema = {}
+            return
+        self.config: dict = _loads(data)
+        self._schema_path = schema_path
+        self._schema_mtime = _mtime(schema_path)
+        if self._schema_mtime is None:
             logger.warning("Configuration schema was not found in %s. Continuing without schema.", schema_path)
             self.schema = {}
             return
-        with open(schema_path, "r", encoding="utf-8") as fid:
-            self.schema = json.load(fid)
-        jsonschema.validate(self.config, self.schema)
+        self.schema, validator = self._get_validator(schema_path, self._schema_mtime)
+        error = jsonschema.exceptions.best_match(validator.iter_errors(self.config))
+        if error is not None:
+            raise error
+
+    @classmethod
+    def _get_validator(cls, schema_path: str, schema_mtime: int) -> Tuple[dict, Any]:
+        """Returns schema and its compiled validator. The schema is only loaded and
+        checked again if it was modified since the last time.
+        """
+        cached = cls._schema_cache.get(schema_path)
+        if cached is not None and cached[0] == schema_mtime:
+            return cached[1], cached[2]
+        with open(schema_path, "rb") as fid:
+            schema = _loads(fid.read())
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema)
+        cls._schema_cache[schema_path] = (schema_mtime, schema, validator)
+        return schema, validator
 
     def get_value(self, path: str, use_list: Optional[bool] = None) -> Any:
         """Return value from json config file using JSON path.
@@ -83,18 +221,55 @@ class ConfigProxy:
         Arguments:
             path {str} -- A JSON path valid string.
         """
-        expr = jsonpath(path).find(self.config)
-        if not expr:
+        return self.find_expr(_compile_path(path), use_list=use_list)
+
+    def find_expr(self, expr: Any, use_list: Optional[bool] = None) -> Any:
+        """Same as `get_value`, but accepts an already parsed JSON path expression.
+
+        Arguments:
+            expr -- A JSON path expression as returned by `jsonpath_ng.parse`,
+                or a tuple of keys and indices of a simple dotted path.
+        """
+        if isinstance(expr, tuple):
+            value = _simple_lookup(self.config, expr)
+            if value is _MISSING:
+                return [] if use_list else None
+            return [value] if use_list else value
+        matches = expr.find(self.config)
+        count = len(matches)
+        if count == 0:
             return [] if use_list else None
-        if use_list:
-            return [e.value for e in expr]
-        elif use_list == False:
-            return expr[0].value
         # Guess whether to return list or not by default
-        if len(expr) == 1:
-            return expr[0].value
-        else:
-            return [e.value for e in expr]
+        if use_list == False or (use_list is None and count == 1):
+            return matches[0].value
+        return list(map(_match_value, matches))
+
+    def get_many(self, paths: Sequence[str], use_list: Optional[bool] = None) -> Dict[str, Any]:
+        """Same as `get_value`, but returns values of multiple paths at once.
+        Simple dotted paths are all looked up during a single walk through the config.
+
+        Arguments:
+            paths {Sequence[str]} -- JSON path valid strings.
+        """
+        trie: Tuple[dict, List[str]] = ({}, [])
+        for path in paths:
+            expr = _compile_path(path)
+            if isinstance(expr, tuple):
+                node = trie
+                for token in expr:
+                    node = node[0].setdefault(token, ({}, []))
+                node[1].append(path)
+        found: Dict[str, Any] = {}
+        _collect_simple(self.config, trie, found)
+        values: Dict[str, Any] = {}
+        for path in paths:
+            if path in found:
+                values[path] = [found[path]] if use_list else found[path]
+            elif isinstance(expr := _compile_path(path), tuple):
+                values[path] = [] if use_list else None
+            else:
+                values[path] = self.find_expr(expr, use_list=use_list)
+        return values
 
     @classmethod
     def get_config_path(cls) -> str:
@@ -105,14 +280,17 @@ class ConfigProxy:
         2. `config_file_names` in current working directory
         """
         if (config_path := os.getenv(cls.env_location, None)) :
-            logger.info("Using config file from env %s=%s", cls.env_location, config_path)
+            logger.debug("Using config file from env %s=%s", cls.env_location, config_path)
+            return config_path
+        # Looked up in class' own namespace, so that subclasses do not reuse their parent's path
+        if (config_path := cls.__dict__.get("_resolved_path")) is not None:
             return config_path
-        wd = os.path.abspath(os.path.dirname("./"))
-        pd = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        paths = [os.path.join(dirname, fname) for dirname in (wd, pd) for fname in cls.config_file_names]
+        dirnames = (os.path.abspath("."), _PD)
+        paths = [os.path.join(dirname, fname) for dirname in dirnames for fname in cls.config_file_names]
         for config_path in paths:
-            logger.info("Searching for config path in %s", config_path)
+            logger.debug("Searching for config path in %s", config_path)
             if os.path.exists(config_path):
+                cls._resolved_path = config_path
                 return config_path
         raise FileNotFoundError(
             (
@@ -127,24 +305,52 @@ class ConfigProxy:
         the correct config file. If this method already was called, existing
         configuration is returned.
         """
-        if cls.current_config:
+        if cls.current_config is not None:
             return cls.current_config
+        cls.current_config = cls(cls._find_config_path())
+        return cls.current_config
+
+    @classmethod
+    def _find_config_path(cls) -> Optional[str]:
+        """Same as `get_config_path`, but returns `None` if the config file
+        was not found and the proxy is not strict.
+        """
         try:
-            config_path = cls.get_config_path()
+            return cls.get_config_path()
         except FileNotFoundError as error:
             if cls.strict:
                 raise error
-            config_path = None
-        cls.current_config = cls(config_path)
-        return cls.current_config
+            return None
 
     @classmethod
     def reload(cls) -> "ConfigProxy":
         """Same as `get_config` but ensures that the configuration file is
-        read again if it already was opened before.
+        read again if it (or its schema) was modified since it was opened before.
         """
+        cls.invalidate_env()
+        # The file found before may be gone, so the usual locations are searched again
+        cls._resolved_path = None
+        config_path = cls._find_config_path()
+        current = cls.current_config
+        if (
+            current is not None
+            and current._config_mtime is not None
+            and config_path == current.config_path
+            and _mtime(current.config_path) == current._config_mtime
+            and (current._schema_path is None or _mtime(current._schema_path) == current._schema_mtime)
+        ):
+            return current
         cls.current_config = None
-        return cls.get_config()
+        cls.current_config = cls(config_path)
+        return cls.current_config
+
+    @classmethod
+    def invalidate_env(cls) -> None:
+        """Properties cache values of environmental variables, call this if you change
+        them during runtime and want the properties to pick the new values up.
+        """
+        # Environment is shared by all proxies, so the generation is always bumped on the base class
+        ConfigProxy._env_generation += 1
 
 
 class ConfigProperty:
@@ -184,9 +390,20 @@ class ConfigProperty:
     ```
     """
 
-    path: Optional[str]
-    env: Optional[str]
-    default: Optional[Any] = None
+    __slots__ = (
+        "_path",
+        "_env",
+        "_default",
+        "_proxy_type",
+        "_expr",
+        "_resolve",
+        "_cached_config",
+        "_cached_value",
+        "_env_gen",
+        "_env_val",
+    )
+
+    use_list: Optional[bool] = None
 
     def __init__(
         self,
@@ -195,19 +412,136 @@ class ConfigProperty:
         default: Optional[Any] = None,
         proxy: Type[ConfigProxy] = ConfigProxy,
     ):
-        self.path = path
-        self.env = env
-        self.default = default
-        self.ProxyType = proxy
+        self._path = path
+        self._env = env
+        self._default = default
+        self._proxy_type = proxy
+        self._expr = _compile_path(path) if path else None
+        self._cached_value: Optional[Any] = None
+        self._env_val: Optional[str] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        """Drops cached values and builds the resolver again, called whenever the property is changed."""
+        self._cached_config: Optional[ConfigProxy] = None
+        self._env_gen = -1
+        self._resolve = self._build_resolver()
 
-    def get_value(self, use_list: Optional[bool] = None, forced: Optional[bool] = None) -> Any:
-        if self.env and (value := os.getenv(self.env, None)):
+    @property
+    def path(self) -> Optional[str]:
+        """JSON path of the value in config file"""
+        return self._path
+
+    @path.setter
+    def path(self, path: Optional[str]) -> None:
+        self._path = path
+        self._expr = _compile_path(path) if path else None
+        self._reset()
+
+    @property
+    def env(self) -> Optional[str]:
+        """Name of the environmental variable that overrides the config file"""
+        return self._env
+
+    @env.setter
+    def env(self, env: Optional[str]) -> None:
+        self._env = env
+        self._reset()
+
+    @property
+    def default(self) -> Optional[Any]:
+        """Value used if there is none in either env or config file"""
+        return self._default
+
+    @default.setter
+    def default(self, default: Optional[Any]) -> None:
+        self._default = default
+        self._reset()
+
+    @property
+    def ProxyType(self) -> Type[ConfigProxy]:  # pylint: disable=invalid-name
+        """`ConfigProxy` (sub)class the value is looked up in"""
+        return self._proxy_type
+
+    @ProxyType.setter
+    def ProxyType(self, proxy: Type[ConfigProxy]) -> None:  # pylint: disable=invalid-name
+        self._proxy_type = proxy
+        self._reset()
+
+    def _build_resolver(self) -> Callable[[], Any]:
+        """Builds function that returns value found either in env, config file or default
+        (`None` if there is none) using class' `use_list`. Only the lookups this property
+        actually needs are included, so that there is no branching on each access.
+        """
+        env, expr, default, proxy, use_list = self.env, self._expr, self.default, self.ProxyType, self.use_list
+        env_lookup = self._get_env
+
+        if expr is None:
+            if env:
+                return lambda: env_lookup() or default
+            return lambda: default
+
+        def lookup() -> Any:
+            # Config does not change until it is reloaded, so the value is cached per config instance
+            config = proxy.get_config()
+            if self._cached_config is not config:
+                self._store_cached(config.find_expr(expr, use_list=use_list), config)
+            return self._get_cached()
+
+        if env:
+            return lambda: env_lookup() or lookup()
+        return lookup
+
+    def _get_env(self) -> Optional[str]:
+        """Returns value of the environmental variable. It is read again only
+        after `ConfigProxy.reload` or `ConfigProxy.invalidate_env`.
+        """
+        generation = ConfigProxy._env_generation
+        if self._env_gen != generation:
+            self._env_val = os.environ.get(self.env)
+            self._env_gen = generation
+        return self._env_val
+
+    def _store_cached(self, value: Any, config: ConfigProxy) -> None:
+        """Stores value found in `config` (or default if there is none)."""
+        self._cached_value = value or self.default
+        self._cached_config = config
+
+    def _get_cached(self) -> Any:
+        """Returns cached value, lists are copied so that callers cannot alter the cache."""
+        value = self._cached_value
+        return value[:] if isinstance(value, list) else value
+
+    @staticmethod
+    def prefetch(properties: Iterable["ConfigProperty"]) -> None:
+        """Looks up config values of all `properties` at once and stores them in their caches,
+        which is faster than letting each of them walk through the config on its first access.
+        """
+        groups: Dict[Tuple[Type[ConfigProxy], Optional[bool]], List[ConfigProperty]] = {}
+        for prop in properties:
+            if prop.path:
+                groups.setdefault((prop.ProxyType, prop.use_list), []).append(prop)
+        for (proxy, use_list), props in groups.items():
+            config = proxy.get_config()
+            values = config.get_many([prop.path for prop in props], use_list=use_list)
+            for prop in props:
+                prop._store_cached(values[prop.path], config)
+
+    def _lookup(self, use_list: Optional[bool]) -> Any:
+        """Same as the function built by `_build_resolver`, but with any `use_list`.
+        Values found in config file are not cached.
+        """
+        if self.env and (value := self._get_env()):
             return value
         config = self.ProxyType.get_config()
-        if self.path and (value := config.get_value(self.path, use_list=use_list)):
+        if self._expr is not None and (value := config.find_expr(self._expr, use_list=use_list)):
+            return value
+        return self.default
+
+    def get_value(self, use_list: Optional[bool] = None, forced: Optional[bool] = None) -> Any:
+        value = self._resolve() if use_list == self.use_list else self._lookup(use_list)
+        if value is not None:
             return value
-        if self.default is not None:
-            return self.default
         if forced:
             raise ValueError(f"Property {self.env} / {self.path} has no value")
         return [] if use_list else None
@@ -226,6 +560,9 @@ class ConfigProperty:
 class StringProperty(ConfigProperty):
     """See `ConfigProperty` for more."""
 
+    __slots__ = ()
+    use_list = False
+
     @property
     def value(self) -> Optional[str]:
         return self.get_value(use_list=False)
@@ -238,6 +575,9 @@ class StringProperty(ConfigProperty):
 class IntProperty(ConfigProperty):
     """See `ConfigProperty` for more."""
 
+    __slots__ = ()
+    use_list = False
+
     @property
     def value(self) -> Optional[int]:
         return self.get_value(use_list=False)
@@ -250,6 +590,9 @@ class IntProperty(ConfigProperty):
 class ListOfIntsProperty(ConfigProperty):
     """See `ConfigProperty` for more."""
 
+    __slots__ = ()
+    use_list = True
+
     @property
     def value(self) -> List[int]:
         return self.get_value(use_list=True)
@@ -258,6 +601,9 @@ class ListOfIntsProperty(ConfigProperty):
 class ListOfStringsProperty(ConfigProperty):
     """See `ConfigProperty` for more."""
 
+    __slots__ = ()
+    use_list = True
+
     @property
     def value(self) -> List[str]:
         return self.get_value(use_list=True)
@@ -266,6 +612,9 @@ class ListOfStringsProperty(ConfigProperty):
 class ListOfObjectsProperty(ConfigProperty):
     """See `ConfigProperty` for more."""
 
+    __slots__ = ()
+    use_list = True
+
     @property
     def value(self) -> List[Dict]:
         return self.get_value(use_list=True)
@@ -274,6 +623,9 @@ class ListOfObjectsProperty(ConfigProperty):
 class ListOfListsProperty(ConfigProperty):
     """See `ConfigProperty` for more."""
 
+    __slots__ = ()
+    use_list = True
+
     @property
     def value(self) -> List[List]:
         return self.get_value(use_list=True)